@@ -1,4 +1,6 @@
 """Main entry point of script."""
+import asyncio
+
 from src.re_backuper import make_re_backup
 
-make_re_backup(60)
+asyncio.run(make_re_backup(60))
@@ -40,6 +40,7 @@ Usage:
 
 
 import os
+import re
 import threading
 import time
 from typing import Any
@@ -127,25 +128,129 @@ class NotificationController:
             default_error_sound_path
         )
 
+        # Check once whether the user-provided overrides actually exist
+        # on disk, so the common "no custom sound" case does not pay a
+        # failed load attempt on every alert.
+        self._use_custom_success = os.path.isfile(
+            self.custom_success_sound_path
+        )
+        self._use_custom_warning = os.path.isfile(
+            self.custom_warning_sound_path
+        )
+        self._use_custom_error = os.path.isfile(self.custom_error_sound_path)
+
         # Construct the full paths to the default notification files
         self.default_success_sound_path = default_success_sound_path
         self.default_error_sound_path = default_error_sound_path
         self.default_warning_sound_path = default_warning_sound_path
         self.log = log
 
+        # pyttsx3.init spins up the TTS driver and loads its voices,
+        # which takes hundreds of milliseconds - do it once and reuse
+        # the engine. The lock serializes access from alert threads.
+        # Audio trouble must never stop the backup job, so a failed
+        # init leaves the engine unset and alert_msg becomes a no-op.
+        self._tts_lock = threading.Lock()
+        self._tts_engine: Any = None
+        try:
+            self._tts_engine = pyttsx3.init()
+        except Exception:
+            self.log.error("TTS driver unavailable, spoken alerts off")
+
+        # Init the mixer once: tearing SDL_mixer down and up again on
+        # every alert costs 50-200 ms. Sound objects are cached per
+        # path, with the default sounds preloaded. A missing audio
+        # device degrades alert_sound to returning False.
+        try:
+            pygame.mixer.init()
+            self._mixer_ok = True
+        except pygame.error:
+            self._mixer_ok = False
+            self.log.error("Audio mixer unavailable, sound alerts off")
+        # Serializes overlapping alerts without blocking the caller:
+        # concurrent alert threads queue on the semaphore instead.
+        self._alert_semaphore = threading.Semaphore(1)
+        self._sounds: dict[str, pygame.mixer.Sound] = {}
+        # Messages pre-synthesized to WAV by prepare_msg, played back
+        # through the mixer without touching the TTS driver again.
+        self._msg_sounds: dict[str, pygame.mixer.Sound] = {}
+        if self._mixer_ok:
+            for sound_path in (
+                default_success_sound_path,
+                default_error_sound_path,
+                default_warning_sound_path,
+            ):
+                try:
+                    self._sounds[sound_path] = pygame.mixer.Sound(sound_path)
+                except (pygame.error, OSError):
+                    # A missing/broken default is reported by
+                    # alert_sound returning False when played.
+                    pass
+
+    def prepare_msg(self, message: str) -> None:
+        """
+        Pre-synthesize a notification message to a cached WAV file.
+
+        Synthesizing speech on every alert pays the TTS driver cost
+        each time; a prepared message is rendered once and then played
+        back through the mixer like any other cached sound.
+
+        Args:
+            message (str): The notification message to pre-synthesize.
+
+        Returns:
+            None
+        """
+        if message in self._msg_sounds:
+            return
+        if self._tts_engine is None or not self._mixer_ok:
+            # Nothing to synthesize with or play through; alert_msg
+            # will degrade on its own.
+            return
+        cache_dir = os.path.dirname(self.default_error_sound_path) or "."
+        safe_name = re.sub(r"\W+", "_", message).strip("_")
+        wav_path = os.path.join(cache_dir, f"_tts_{safe_name}.wav")
+        try:
+            with self._tts_lock:
+                self._tts_engine.save_to_file(message, wav_path)
+                self._tts_engine.runAndWait()
+        except Exception:
+            # Failed synthesis or an unwritable cache dir: alert_msg
+            # falls back to live synthesis for this message.
+            self.log.error(f"Failed to pre-synthesize message: {message}")
+            return
+        try:
+            self._msg_sounds[message] = pygame.mixer.Sound(wav_path)
+        except (pygame.error, OSError):
+            # Fall back to live synthesis in alert_msg
+            pass
+
     def alert_msg(self, message: str) -> None:
         """
         Play a notification message.
 
+        A message pre-synthesized with prepare_msg is played from the
+        cached WAV; anything else is synthesized live. The alert
+        semaphore serializes the message with any sound alert already
+        playing so the clips do not talk over each other.
+
         Args:
             message (str): The notification message to play.
 
         Returns:
             None
         """
-        engine = pyttsx3.init()
-        engine.say(message)
-        engine.runAndWait()
+        with self._alert_semaphore:
+            sound = self._msg_sounds.get(message)
+            if sound is not None:
+                sound.play()
+                time.sleep(sound.get_length())
+                return
+            if self._tts_engine is None:
+                return
+            with self._tts_lock:
+                self._tts_engine.say(message)
+                self._tts_engine.runAndWait()
 
     def alert_sound(self, sound_file_path: str) -> bool:
         """
@@ -158,22 +263,22 @@ class NotificationController:
             bool: True if the sound played successfully, False otherwise.
         """
 
+        if not self._mixer_ok:
+            return False
         try:
-            # Initialize pygame audio
-            pygame.mixer.init()
-
-            pygame.mixer.music.load(sound_file_path)
-            pygame.mixer.music.play()
+            sound = self._sounds.get(sound_file_path)
+            if sound is None:
+                sound = pygame.mixer.Sound(sound_file_path)
+                self._sounds[sound_file_path] = sound
 
-            # Wait until the music finishes playing
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
+            sound.play()
 
-            pygame.mixer.music.stop()
-            pygame.mixer.quit()
+            # Sleep the exact clip duration instead of waking up to
+            # poll the channel while the sound plays
+            time.sleep(sound.get_length())
 
             return True
-        except Exception:
+        except (pygame.error, OSError):
             # self.log.write_log(
             # f" ERROR Не найден файл уведомления {sound_file_path}")
             return False
@@ -186,9 +291,12 @@ class NotificationController:
         Returns:
             bool: True if the sound played successfully, False otherwise.
         """
-        if not self.alert_sound(self.custom_success_sound_path):
+        with self._alert_semaphore:
+            if self._use_custom_success and self.alert_sound(
+                self.custom_success_sound_path
+            ):
+                return True
             return self.alert_sound(self.default_success_sound_path)
-        return True
 
     def alert_success(self) -> None:
         """
@@ -197,7 +305,6 @@ class NotificationController:
         default one.
         """
         threading.Thread(target=self._alert_success).start()
-        time.sleep(1)
 
     def alert_warning(self) -> None:
         """
@@ -206,15 +313,18 @@ class NotificationController:
         the default one.
         """
         threading.Thread(target=self._alert_warning).start()
-        time.sleep(1)
 
     def _alert_warning(self) -> None:
         """
         Play a custom warning notification sound if it exists or
         the default one.
         """
-        if not self.alert_sound(self.custom_warning_sound_path):
-            self.alert_sound(self.default_warning_sound_path)
+        with self._alert_semaphore:
+            if not (
+                self._use_custom_warning
+                and self.alert_sound(self.custom_warning_sound_path)
+            ):
+                self.alert_sound(self.default_warning_sound_path)
 
     def _alert_error(self) -> bool:
         """
@@ -223,9 +333,12 @@ class NotificationController:
         Returns:
             bool: True if the sound played successfully, False otherwise.
         """
-        if not self.alert_sound(self.custom_error_sound_path):
+        with self._alert_semaphore:
+            if self._use_custom_error and self.alert_sound(
+                self.custom_error_sound_path
+            ):
+                return True
             return self.alert_sound(self.default_error_sound_path)
-        return True
 
     def alert_error(self) -> None:
         """
@@ -233,4 +346,3 @@ class NotificationController:
         Play a custom error notification sound if it exists or the default one.
         """
         threading.Thread(target=self._alert_error).start()
-        time.sleep(1)